@@ -8,82 +8,107 @@ ALLOWED_PATH = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("config/ebay_all
 SEED_PATH = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("data/seeds/ebay_seed_urls_LEAN_with_photo_OPT.csv")
 REPORT_PATH = Path(sys.argv[3]) if len(sys.argv) > 3 else Path("data/seeds/ebay_seed_validation_report.csv")
 
-def is_number(x):
-    try:
-        float(x)
-        return True
-    except:
-        return False
+REPORT_COLS = ["row", "field", "issue"]
+
+CHUNK_SIZE = 1024
+
+RETURNS_WITHIN_RE = re.compile(r"Days_\d+")
+
+CALCULATED_SHIPPING_FIELDS = ["Weight_lbs","Weight_oz","Depth_in","Length_in","Width_in",
+                              "WeightMajor_lbs","WeightMinor_oz","PackageDepth_in","PackageLength_in","PackageWidth_in"]
+
+USED_COLS = ["URL","Price","PriceOverride","Quantity","QuantityOverride","FlatCost","ShippingService1_Cost",
+             "ReturnsWithinOverride","ReturnsAcceptedOverride","ShippingType","ShippingCostPaidByOverride",
+             "Condition","ConditionOverride"] + CALCULATED_SHIPPING_FIELDS
+
+def stripped(df, col):
+    # Missing columns behave like all-blank ones (same as row.get(col, ""))
+    if col in df.columns:
+        return df[col].str.strip()
+    return pd.Series("", index=df.index)
+
+def flag(issues, df, mask, field, issue):
+    # Record one issue per offending row; `issue` may be a per-row Series
+    if not mask.any():
+        return
+    if isinstance(issue, pd.Series):
+        issue = issue[mask].to_numpy()
+    issues.append(pd.DataFrame({"row": df.index[mask] + 2, "field": field, "issue": issue}))
+
+def check_chunk(df, allowed, issues):
+    # Strip every column the checks read exactly once
+    cols = {c: stripped(df, c) for c in USED_COLS}
+
+    flag(issues, df, cols["URL"].eq(""), "URL", "URL is required")
+
+    po = cols["Price"]
+    po = po.where(po.ne(""), cols["PriceOverride"])
+    po_num = pd.to_numeric(po, errors="coerce")
+    flag(issues, df, po.ne("") & po_num.isna(), "Price", "Must be numeric")
+    flag(issues, df, po_num.le(0), "Price", "Must be > 0")
+
+    qo = cols["Quantity"]
+    qo = qo.where(qo.ne(""), cols["QuantityOverride"])
+    qo_digits = qo.str.isdigit()
+    flag(issues, df, qo.ne("") & ~qo_digits, "Quantity", "Must be an integer >= 1")
+    flag(issues, df, pd.to_numeric(qo.where(qo_digits), errors="coerce").lt(1), "Quantity", "Must be >= 1")
+
+    sc = cols["FlatCost"]
+    sc = sc.where(sc.ne(""), cols["ShippingService1_Cost"])
+    sc_num = pd.to_numeric(sc, errors="coerce")
+    flag(issues, df, sc.ne("") & sc_num.isna(), "FlatCost", "Must be numeric")
+    flag(issues, df, sc_num.lt(0), "FlatCost", "Must be >= 0")
+
+    rwithin = cols["ReturnsWithinOverride"]
+    flag(issues, df, rwithin.ne("") & ~rwithin.str.fullmatch(RETURNS_WITHIN_RE),
+         "ReturnsWithinOverride", "Use format Days_30, Days_60, etc.")
+
+    for field, allowed_list_key in [
+        ("ReturnsAcceptedOverride", "ReturnsAcceptedOverride"),
+        ("ShippingType", "ShippingTypeOverride"),
+        ("ShippingCostPaidByOverride", "ShippingCostPaidByOverride"),
+    ]:
+        val = cols[field]
+        allowed_list = allowed.get(allowed_list_key, [])
+        flag(issues, df, val.ne("") & ~val.isin(allowed_list), field,
+             "Value '" + val + f"' not in allowed: {allowed_list}")
+
+    calc_mask = cols["ShippingType"].eq("Calculated")
+    calc_fields = [f for f in CALCULATED_SHIPPING_FIELDS if f in df.columns]
+    for f in calc_fields:
+        flag(issues, df, calc_mask & cols[f].eq(""), f, "Required for Calculated shipping")
+    for f in calc_fields:
+        v = cols[f]
+        flag(issues, df, calc_mask & v.ne("") & pd.to_numeric(v, errors="coerce").isna(), f, "Must be numeric")
+
+    cond = cols["Condition"]
+    cond = cond.where(cond.ne(""), cols["ConditionOverride"])
+    allowed_conds = list(allowed["ConditionOverride_to_ConditionID"].keys())
+    flag(issues, df, cond.ne("") & ~cond.isin(allowed_conds), "Condition",
+         "Unknown condition '" + cond + f"'. Allowed: {allowed_conds}")
 
 def main():
     allowed = json.loads(ALLOWED_PATH.read_text())
-    df = pd.read_csv(SEED_PATH, dtype=str).fillna("")
     issues = []
 
-    required_cols = ["URL"]
-    for c in required_cols:
-        if c not in df.columns:
-            issues.append({"row": 0, "field": c, "issue": "Missing required column in seed file"})
-    
-    for idx, row in df.iterrows():
-        if not row.get("URL", "").strip():
-            issues.append({"row": idx+2, "field": "URL", "issue": "URL is required"})
-        
-        po = row.get("Price","").strip() or row.get("PriceOverride","").strip()
-        if po and not is_number(po):
-            issues.append({"row": idx+2, "field": "Price", "issue": "Must be numeric"})
-        if po and is_number(po) and float(po) <= 0:
-            issues.append({"row": idx+2, "field": "Price", "issue": "Must be > 0"})
-        
-        qo = row.get("Quantity","").strip() or row.get("QuantityOverride","").strip()
-        if qo:
-            if not qo.isdigit():
-                issues.append({"row": idx+2, "field": "Quantity", "issue": "Must be an integer >= 1"})
-            elif int(qo) < 1:
-                issues.append({"row": idx+2, "field": "Quantity", "issue": "Must be >= 1"})
-        
-        sc = row.get("FlatCost","").strip() or row.get("ShippingService1_Cost","").strip()
-        if sc:
-            if not is_number(sc):
-                issues.append({"row": idx+2, "field": "FlatCost", "issue": "Must be numeric"})
-            elif float(sc) < 0:
-                issues.append({"row": idx+2, "field": "FlatCost", "issue": "Must be >= 0"})
-        
-        rwithin = row.get("ReturnsWithinOverride","").strip()
-        if rwithin and not re.fullmatch(r"Days_\d+", rwithin):
-            issues.append({"row": idx+2, "field": "ReturnsWithinOverride", "issue": "Use format Days_30, Days_60, etc."})
-        
-        for field, allowed_list_key in [
-            ("ReturnsAcceptedOverride", "ReturnsAcceptedOverride"),
-            ("ShippingType", "ShippingTypeOverride"),
-            ("ShippingCostPaidByOverride", "ShippingCostPaidByOverride"),
-        ]:
-            val = row.get(field, "").strip()
-            if val and val not in allowed.get(allowed_list_key, []):
-                issues.append({"row": idx+2, "field": field, "issue": f"Value '{val}' not in allowed: {allowed.get(allowed_list_key, [])}"})
-        
-        ship_type = row.get("ShippingType","").strip()
-        if ship_type == "Calculated":
-            for f in ["Weight_lbs","Weight_oz","Depth_in","Length_in","Width_in",
-                      "WeightMajor_lbs","WeightMinor_oz","PackageDepth_in","PackageLength_in","PackageWidth_in"]:
-                if (f in df.columns) and (not row.get(f,"").strip()):
-                    issues.append({"row": idx+2, "field": f, "issue": "Required for Calculated shipping"})
-            for f in ["Weight_lbs","Weight_oz","Depth_in","Length_in","Width_in",
-                      "WeightMajor_lbs","WeightMinor_oz","PackageDepth_in","PackageLength_in","PackageWidth_in"]:
-                if f in df.columns:
-                    v = row.get(f,"").strip()
-                    if v and not is_number(v):
-                        issues.append({"row": idx+2, "field": f, "issue": "Must be numeric"})
-        
-        cond = row.get("Condition","").strip() or row.get("ConditionOverride","").strip()
-        if cond and cond not in allowed["ConditionOverride_to_ConditionID"]:
-            issues.append({"row": idx+2, "field": "Condition", "issue": f"Unknown condition '{cond}'. Allowed: {list(allowed['ConditionOverride_to_ConditionID'].keys())}"})
-    
-    report = pd.DataFrame(issues, columns=["row","field","issue"])
+    # Stream the seed so only one chunk of rows is held (and blank-filled) at a time;
+    # chunk indexes continue across chunks, so reported row numbers stay file-relative
+    with pd.read_csv(SEED_PATH, dtype=str, chunksize=CHUNK_SIZE) as reader:
+        for n, chunk in enumerate(reader):
+            df = chunk.fillna("")
+            if n == 0:
+                required_cols = ["URL"]
+                for c in required_cols:
+                    if c not in df.columns:
+                        issues.append(pd.DataFrame([{"row": 0, "field": c, "issue": "Missing required column in seed file"}]))
+            check_chunk(df, allowed, issues)
+
+    # Checks run column-by-column; a stable sort restores the per-row report order
+    report = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=REPORT_COLS)
+    report = report.sort_values("row", kind="stable")
     report.to_csv(REPORT_PATH, index=False)
     print(f"Validation complete. Issues: {len(report)}")
     print(f"Report saved to: {REPORT_PATH}")
 
 if __name__ == "__main__":
     main()
-
@@ -1,16 +1,24 @@
 
 import os
 import re
+import csv
+import hashlib
 import json
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import pandas as pd
 
 # Optional Selenium imports
@@ -22,12 +30,18 @@ try:
 except Exception:
     webdriver = None
 
+# Resolved by chromedriver_path() on first use
+_CHROMEDRIVER_PATH: Optional[str] = None
+
 # Optional OpenAI (optimization)
 try:
     from openai import OpenAI
 except Exception:
     OpenAI = None
 
+# Built once so every optimization request shares one HTTP connection pool
+_OPENAI_CLIENT = OpenAI(api_key=os.environ["OPENAI_API_KEY"]) if (OpenAI and os.environ.get("OPENAI_API_KEY")) else None
+
 TITLE_PROMPT = """You are an expert eBay seller. Rewrite this title to maximize clicks and keyword relevance.
 Rules:
 - ≤ 80 characters (hard limit).
@@ -68,10 +82,40 @@ DEFAULTS = {
     "PostagePaidBy": "Buyer",
 }
 
+PREVIEW_COLS = ["URL", "Title_Scraped", "Title_Optimized", "TitleLen_Scraped", "TitleLen_Optimized",
+                "Desc_Scraped_Snippet", "Desc_Optimized_Snippet", "PhotoURL", "PostagePaidBy"]
+
+SEED_CHUNK_SIZE = 1024
+
+# One session shared by all scrape threads so connections to eBay are reused
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# On-disk cache of fetched listing pages, so reruns skip the network
+PAGE_CACHE_DIR = Path(".cache") / "ebay_pages"
+PAGE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _class_selector(tags: List[str], class_parts: List[str]) -> str:
+    # CSS equivalent of matching a case-insensitive substring of the class attribute
+    return ", ".join(f'{t}[class*="{c}" i]' for t in tags for c in class_parts)
+
+
+# Patterns and selectors used while scraping each listing (built once, not per URL)
+_RE_COND_LABEL = re.compile(r"(?:condition:?|item condition)", re.I)
+_RE_COND_LABELS = [re.compile(lbl, re.I) for lbl in ["Condition:", "Condition", "Item condition"]]  # in priority order
+_RE_VALUES = re.compile(r"(attrLabels|ux-labels-values__values-content|val)", re.I)
+_CSS_TITLE = ["h1#itemTitle", _class_selector(["h1"], ["item-title"])]
+_CSS_DESC = ["div#desc_div", "div#viTabs_0_is", "div#vi-desc-maincntr", _class_selector(["div"], ["item-desc"])]
+_CSS_SPECIFICS_SEC = _class_selector(["div", "section"], ["itemAttr", "itemSpecifics", "ux-layout-section-evo__section-content"])
+_CSS_LABELS = _class_selector(["td", "span", "div"], ["attrLabels", "ux-labels-values__labels-content"])
+
 @dataclass
 class ScrapeResult:
     title: str = ""
     description_html: str = ""
+    description_text: str = ""
     price: Optional[float] = None
     category_id: str = ""
     condition_text: str = ""
@@ -88,15 +132,55 @@ def default_path_near_seed(seed_path: str, basename: str) -> str:
     return str(seed_dir / f"{basename}_{timestamp_str()}.csv")
 
 
-def fetch_page(url: str, timeout: int = 20) -> str:
+def write_csv(path: str, header: List[str], rows) -> None:
+    # All cells are already strings, so stream rows straight to csv.writer
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, lineterminator=os.linesep)
+        w.writerow(header)
+        w.writerows(rows)
+
+
+def fetch_page(url: str, timeout: int = 20, use_cache: bool = True) -> str:
+    cache_path = PAGE_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < PAGE_CACHE_TTL:
+                return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = _SESSION.get(url, headers=headers, timeout=timeout)
     r.raise_for_status()
+
+    if use_cache:
+        try:
+            PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent scrapes never read a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(r.text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
     return r.text
 
 
+def html_to_text(h: str) -> str:
+    # Same text as BeautifulSoup(h, "lxml").get_text("\n", strip=True), without building a bs4 tree.
+    # Parsed as UTF-8 bytes so a str carrying an <?xml ... encoding=...?> declaration is accepted
+    # (the explicit parser encoding stops a <meta charset> in the markup from overriding it).
+    try:
+        doc = lxml_html.fromstring(h.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8"))
+    except etree.ParserError:
+        return ""
+    except ValueError:
+        return BeautifulSoup(h, "lxml").get_text("\n", strip=True)
+    etree.strip_elements(doc, "script", "style", "template", with_tail=False)
+    return "\n".join(t.strip() for t in doc.itertext() if t.strip())
+
+
 def parse_json_ld(soup: BeautifulSoup) -> Dict:
     data = {}
     for tag in soup.find_all("script", type="application/ld+json"):
@@ -113,16 +197,66 @@ def parse_json_ld(soup: BeautifulSoup) -> Dict:
     return data
 
 
-def extract_text(soup, selector_list: List[Tuple[str, Dict]]) -> str:
-    for name, attrs in selector_list:
-        el = soup.find(name, attrs=attrs)
+def extract_text(soup, selector_list: List[str]) -> str:
+    for selector in selector_list:
+        el = soup.select_one(selector)
         if el and el.get_text(strip=True):
             return el.get_text(" ", strip=True)
     return ""
 
 
-def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = True) -> ScrapeResult:
-    html_text = fetch_page(url)
+def chromedriver_path() -> str:
+    # ChromeDriverManager().install() does a network version check, so run it at most once
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return _CHROMEDRIVER_PATH
+
+
+@contextmanager
+def selenium_driver(headless: bool = True):
+    # Yields a getter that starts Chrome on its first call and returns the same driver after that,
+    # so runs that never need the iframe fallback never launch a browser
+    started = []
+
+    def get_driver():
+        if not started:
+            options = ChromeOptions()
+            if headless:
+                options.add_argument("--headless=new")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            started.append(webdriver.Chrome(chromedriver_path(), options=options))
+        return started[0]
+
+    try:
+        yield get_driver
+    finally:
+        for driver in started:
+            driver.quit()
+
+
+def selenium_iframe_html(driver, url: str) -> str:
+    driver.get(url)
+    time.sleep(2.5)
+    iframes = driver.find_elements(By.TAG_NAME, "iframe")
+    for iframe in iframes:
+        try:
+            driver.switch_to.frame(iframe)
+            time.sleep(0.5)
+            html_source = driver.page_source
+            driver.switch_to.default_content()
+            if "html" in html_source.lower():
+                return html_source
+        except Exception:
+            driver.switch_to.default_content()
+            continue
+    return ""
+
+
+def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = True, use_cache: bool = True,
+                        get_driver: Optional[Callable] = None) -> ScrapeResult:
+    html_text = fetch_page(url, use_cache=use_cache)
     soup = BeautifulSoup(html_text, "lxml")
 
     result = ScrapeResult()
@@ -132,10 +266,7 @@ def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = T
     offer = ld.get("Offer", {})
 
     # Title
-    result.title = product.get("name") or extract_text(soup, [
-        ("h1", {"id": "itemTitle"}),
-        ("h1", {"class": re.compile(r".*item-title.*", re.I)})
-    ])
+    result.title = product.get("name") or extract_text(soup, _CSS_TITLE)
 
     # Price
     if offer.get("price"):
@@ -155,15 +286,13 @@ def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = T
 
     # Condition
     condition_text = ""
-    for lbl in ["Condition:", "Condition", "Item condition"]:
-        el = soup.find(text=re.compile(lbl, re.I))
-        if el and hasattr(el, "parent"):
-            txt = el.parent.get_text(" ", strip=True)
-            if ":" in txt:
-                condition_text = txt.split(":", 1)[1].strip()
-            else:
-                condition_text = txt.strip()
-            break
+    # One walk for every candidate label; script/style text (e.g. JSON-LD "itemCondition") is not a label
+    nodes = [n for n in soup.find_all(string=_RE_COND_LABEL)
+             if n.parent is not None and n.parent.name not in ("script", "style", "template")]
+    el = next((n for lbl_re in _RE_COND_LABELS for n in nodes if lbl_re.search(n)), None)
+    if el is not None:
+        txt = el.parent.get_text(" ", strip=True)
+        condition_text = txt.split(":", 1)[-1].strip()
     result.condition_text = condition_text or product.get("itemCondition", "")
 
     # Images
@@ -178,57 +307,33 @@ def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = T
 
     # Description (basic)
     description = ""
-    desc_candidates = [
-        ("div", {"id": "desc_div"}),
-        ("div", {"id": "viTabs_0_is"}),
-        ("div", {"id": "vi-desc-maincntr"}),
-        ("div", {"class": re.compile(r".*item-desc.*", re.I)}),
-        ("div", {"class": re.compile(r".*d-item-desc.*", re.I)}),
-    ]
-    for name, attrs in desc_candidates:
-        el = soup.find(name, attrs=attrs)
+    description_text = ""
+    for selector in _CSS_DESC:
+        el = soup.select_one(selector)
         if el:
             description = str(el)
+            description_text = el.get_text("\n", strip=True)
             break
 
-    # Selenium fallback for iframe description
+    # Selenium fallback for iframe description (reuses the caller's driver when given)
     if use_selenium and webdriver is not None and not description:
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        driver = webdriver.Chrome(ChromeDriverManager().install(), options=options)
-        try:
-            driver.get(url)
-            time.sleep(2.5)
-            iframes = driver.find_elements(By.TAG_NAME, "iframe")
-            for iframe in iframes:
-                try:
-                    driver.switch_to.frame(iframe)
-                    time.sleep(0.5)
-                    html_source = driver.page_source
-                    if "html" in html_source.lower():
-                        description = html_source
-                        driver.switch_to.default_content()
-                        break
-                    driver.switch_to.default_content()
-                except Exception:
-                    driver.switch_to.default_content()
-                    continue
-        finally:
-            driver.quit()
+        if get_driver is not None:
+            description = selenium_iframe_html(get_driver(), url)
+        else:
+            with selenium_driver(headless=headless) as get_own_driver:
+                description = selenium_iframe_html(get_own_driver(), url)
+        if description:
+            description_text = html_to_text(description)
 
     result.description_html = description
+    result.description_text = description_text
 
     # Item specifics (best-effort)
     item_specifics = {}
-    specifics_sections = soup.find_all(["div", "section"], attrs={"class": re.compile(r"(itemAttr|itemSpecifics|ux-layout-section-evo__section-content)", re.I)})
-    for sec in specifics_sections:
-        labels = sec.find_all(["td", "span", "div"], attrs={"class": re.compile(r"(attrLabels|ux-labels-values__labels-content)", re.I)})
-        for lbl in labels:
+    for sec in soup.select(_CSS_SPECIFICS_SEC):
+        for lbl in sec.select(_CSS_LABELS):
             key = lbl.get_text(" ", strip=True).strip(":")
-            val = lbl.find_next(["td", "span", "div"], attrs={"class": re.compile(r"(attrLabels|ux-labels-values__values-content|val)", re.I)})
+            val = lbl.find_next(["td", "span", "div"], attrs={"class": _RE_VALUES})
             if val:
                 vtxt = val.get_text(" ", strip=True)
                 if key and vtxt:
@@ -239,15 +344,11 @@ def scrape_ebay_listing(url: str, use_selenium: bool = False, headless: bool = T
 
 
 def openai_optimize(text: str, is_title: bool, model: str = "gpt-4o-mini") -> str:
-    if not OpenAI:
+    if _OPENAI_CLIENT is None:
         return text
-    api_key = os.environ.get("OPENAI_API_KEY", "")
-    if not api_key:
-        return text
-    client = OpenAI(api_key=api_key)
     prompt = TITLE_PROMPT.format(title=text) if is_title else DESC_PROMPT.format(description=text)
     try:
-        resp = client.chat.completions.create(
+        resp = _OPENAI_CLIENT.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -261,6 +362,23 @@ def openai_optimize(text: str, is_title: bool, model: str = "gpt-4o-mini") -> st
         return text
 
 
+def openai_optimize_many(texts: List[str], is_title: bool, model: str = "gpt-4o-mini", max_workers: int = 8) -> List[str]:
+    # Requests in the batch run concurrently over the shared client
+    if _OPENAI_CLIENT is None or not texts:
+        return list(texts)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(lambda t: openai_optimize(t, is_title, model=model), texts))
+
+
+def optimize_selected(texts: List[str], selected: List[bool], is_title: bool) -> List[str]:
+    # Optimize only the selected texts in a single batch; the rest pass through unchanged
+    out = list(texts)
+    idx = [i for i, sel in enumerate(selected) if sel]
+    for i, opt in zip(idx, openai_optimize_many([texts[i] for i in idx], is_title=is_title)):
+        out[i] = opt
+    return out
+
+
 def normalize_price(val: Optional[str], scraped: Optional[float]) -> Optional[float]:
     if val:
         try:
@@ -271,6 +389,8 @@ def normalize_price(val: Optional[str], scraped: Optional[float]) -> Optional[fl
 
 
 def build_output_row(headers: List[str],
+                     header_index: Dict[str, int],
+                     c_headers: List[Tuple[str, str]],
                      seed: Dict[str, str],
                      scraped_title: str,
                      scraped_desc_text: str,
@@ -279,98 +399,109 @@ def build_output_row(headers: List[str],
                      condition_text: str,
                      images: List[str],
                      scraped_specifics: Dict[str, str]) -> List[str]:
-    row = {h: "" for h in headers}
+    # Only the scrape-dependent cells; seed-only columns are filled by fill_seed_columns
+    row = [""] * len(headers)
 
-    # Action
-    action_col = next((h for h in headers if h.startswith("*Action(")), None)
-    if action_col:
-        row[action_col] = "Add"
-
-    # Custom label
-    row["CustomLabel"] = seed.get("CustomLabel", "")
+    def put(h: str, v: str):
+        i = header_index.get(h)
+        if i is not None:
+            row[i] = v
 
     # Category
-    if "*Category" in headers:
-        row["*Category"] = category_id or ""
+    put("*Category", category_id or "")
 
     # Title
-    if "*Title" in headers:
-        row["*Title"] = scraped_title
-
-    # Subtitle
-    if "Subtitle" in headers:
-        row["Subtitle"] = ""
-
-    # Condition
-    cond_override = seed.get("Condition", "").strip() or seed.get("ConditionOverride","").strip()
-    if cond_override in CONDITION_MAP:
-        cond_id = CONDITION_MAP[cond_override]
-    else:
-        cond_id = 3000  # default Used
-    if "*ConditionID" in headers:
-        row["*ConditionID"] = str(cond_id)
+    put("*Title", scraped_title)
 
     # Description
-    if "*Description" in headers:
-        row["*Description"] = scraped_desc_text
+    put("*Description", scraped_desc_text)
 
-    # Format/Duration
-    if "*Format" in headers:
-        row["*Format"] = seed.get("FormatOverride", DEFAULTS["Format"])
-    if "*Duration" in headers:
-        if row["*Format"] == "FixedPrice":
-            row["*Duration"] = DEFAULTS["DurationFixedPrice"]
-        else:
-            row["*Duration"] = seed.get("DurationOverride", DEFAULTS["DurationAuction"])
-
-    # Price/Quantity
+    # Price
     price_val = normalize_price(seed.get("Price") or seed.get("PriceOverride"), price)
-    if "*StartPrice" in headers and price_val is not None:
-        row["*StartPrice"] = f"{price_val:.2f}"
-    if "*Quantity" in headers:
-        qty = seed.get("Quantity") or seed.get("QuantityOverride") or str(DEFAULTS["Quantity"])
-        row["*Quantity"] = qty
+    if price_val is not None:
+        put("*StartPrice", f"{price_val:.2f}")
 
     # PictureURL
-    picture_url = seed.get("PhotoURL", "").strip() or (images[0] if images else "")
-    if "PictureURL" in headers:
-        row["PictureURL"] = picture_url
+    put("PictureURL", seed.get("PhotoURL", "").strip() or (images[0] if images else ""))
+
+    # Item specifics (scraped best-effort; seed values fill in the gaps later)
+    for h, key in c_headers:
+        if key in scraped_specifics and scraped_specifics[key]:
+            put(h, scraped_specifics[key])
+
+    return row
+
+
+def seed_column(seed_df: pd.DataFrame, name: str, default: str = "") -> pd.Series:
+    # Column-wise seed.get(name, default)
+    if name in seed_df.columns:
+        return seed_df[name]
+    return pd.Series(default, index=seed_df.index, dtype=object)
+
+
+def first_non_blank(*cols: pd.Series) -> pd.Series:
+    # Column-wise `a or b or c` for string columns
+    out = cols[0]
+    for c in cols[1:]:
+        out = out.where(out.ne(""), c)
+    return out
+
+
+def fill_seed_columns(out: pd.DataFrame, seed_df: pd.DataFrame, action_col: Optional[str]):
+    # Columns that depend only on the seed (or on nothing) are assigned a whole column at a time
+    def assign(h: str, values):
+        if h in out.columns:
+            out[h] = values.to_numpy() if isinstance(values, pd.Series) else values
+
+    # Action
+    if action_col:
+        assign(action_col, "Add")
+
+    # Custom label
+    assign("CustomLabel", seed_column(seed_df, "CustomLabel"))
+
+    # Condition
+    cond = first_non_blank(seed_column(seed_df, "Condition").str.strip(),
+                           seed_column(seed_df, "ConditionOverride").str.strip())
+    assign("*ConditionID", cond.map(CONDITION_MAP).fillna(3000).astype(int).astype(str))  # default Used
+
+    # Format/Duration
+    fmt = first_non_blank(seed_column(seed_df, "FormatOverride"), pd.Series(DEFAULTS["Format"], index=seed_df.index))
+    duration = first_non_blank(seed_column(seed_df, "DurationOverride"),
+                               pd.Series(DEFAULTS["DurationAuction"], index=seed_df.index))
+    assign("*Format", fmt)
+    assign("*Duration", duration.where(fmt.ne("FixedPrice"), DEFAULTS["DurationFixedPrice"]))
+
+    # Quantity
+    assign("*Quantity", first_non_blank(seed_column(seed_df, "Quantity"), seed_column(seed_df, "QuantityOverride"),
+                                        pd.Series(str(DEFAULTS["Quantity"]), index=seed_df.index)))
 
     # Shipping/Returns
-    ship_type = seed.get("ShippingType", "").strip() or seed.get("ShippingTypeOverride","").strip() or DEFAULTS["ShippingType"]
-    if "ShippingType" in headers:
-        row["ShippingType"] = ship_type
-    if "*Location" in headers:
-        row["*Location"] = seed.get("LocationOverride","") or DEFAULTS["Location"]
-    if ship_type == "Flat":
-        if "ShippingService-1:Option" in headers:
-            row["ShippingService-1:Option"] = seed.get("FlatService","") or seed.get("ShippingService1_Option","")
-        if "ShippingService-1:Cost" in headers:
-            row["ShippingService-1:Cost"] = seed.get("FlatCost","") or seed.get("ShippingService1_Cost","")
-
-    if "*ReturnsAcceptedOption" in headers:
-        row["*ReturnsAcceptedOption"] = "ReturnsAccepted"
-    if "ShippingCostPaidByOption" in headers:
-        row["ShippingCostPaidByOption"] = seed.get("PostagePaidBy","Buyer")
-
-    # Item specifics (selected + scraped best-effort)
+    ship_type = first_non_blank(seed_column(seed_df, "ShippingType").str.strip(),
+                                seed_column(seed_df, "ShippingTypeOverride").str.strip(),
+                                pd.Series(DEFAULTS["ShippingType"], index=seed_df.index))
+    is_flat = ship_type.eq("Flat")
+    assign("ShippingType", ship_type)
+    assign("*Location", first_non_blank(seed_column(seed_df, "LocationOverride"),
+                                        pd.Series(DEFAULTS["Location"], index=seed_df.index)))
+    assign("ShippingService-1:Option", first_non_blank(seed_column(seed_df, "FlatService"),
+                                                       seed_column(seed_df, "ShippingService1_Option")).where(is_flat, ""))
+    assign("ShippingService-1:Cost", first_non_blank(seed_column(seed_df, "FlatCost"),
+                                                     seed_column(seed_df, "ShippingService1_Cost")).where(is_flat, ""))
+
+    assign("*ReturnsAcceptedOption", "ReturnsAccepted")
+    assign("ShippingCostPaidByOption", seed_column(seed_df, "PostagePaidBy", "Buyer"))
+
+    # Item specifics from the seed; scraped values already in `out` take precedence
     specifics_map = {
-        "C:Card Condition": seed.get("CardCondition",""),
-        "CD:Professional Grader - (ID: 27501)": seed.get("ProfessionalGrader",""),
-        "CD:Grade - (ID: 27502)": seed.get("Grade",""),
-        "CDA:Certification Number - (ID: 27503)": seed.get("CertNumber",""),
+        "C:Card Condition": "CardCondition",
+        "CD:Professional Grader - (ID: 27501)": "ProfessionalGrader",
+        "CD:Grade - (ID: 27502)": "Grade",
+        "CDA:Certification Number - (ID: 27503)": "CertNumber",
     }
-    for k, v in specifics_map.items():
-        if k in headers and v:
-            row[k] = v
-
-    for h in headers:
-        if h.startswith("C:"):
-            key = h.replace("C:", "").strip()
-            if key in scraped_specifics and scraped_specifics[key]:
-                row[h] = scraped_specifics[key]
-
-    return [row.get(h, "") for h in headers]
+    for h, seed_col in specifics_map.items():
+        if h in out.columns:
+            assign(h, first_non_blank(out[h], seed_column(seed_df, seed_col)))
 
 
 def main():
@@ -381,6 +512,8 @@ def main():
     ap.add_argument("--optimize", type=int, default=1)
     ap.add_argument("--use_selenium", type=int, default=0)
     ap.add_argument("--headless", type=int, default=1)
+    ap.add_argument("--no_cache", type=int, default=0, help="If 1, refetch every listing instead of using the on-disk page cache (.cache/ebay_pages, 24h)")
+    ap.add_argument("--workers", type=int, default=16, help="Listings fetched concurrently (Selenium runs always use 1)")
     # Dry-run flags
     ap.add_argument("--dry_run", type=int, default=0, help="If 1, write a side-by-side preview CSV")
     ap.add_argument("--preview", required=False, help="Preview CSV path. If omitted with --dry_run=1, saves next to seed as EBAY_PREVIEW_<timestamp>.csv")
@@ -391,7 +524,10 @@ def main():
     tpl_df = pd.read_csv(args.template, dtype=str, header=None)
     headers = tpl_df.iloc[0].dropna().tolist()
 
-    seed_df = pd.read_csv(args.seed, dtype=str).fillna("")
+    # Header lookups are the same for every row, so work them out once
+    header_index = {h: i for i, h in enumerate(headers)}
+    action_col = next((h for h in headers if h.startswith("*Action(")), None)
+    c_headers = [(h, h.replace("C:", "").strip()) for h in headers if h.startswith("C:")]
 
     # Default paths (when omitted)
     if args.dry_run and not args.preview:
@@ -402,22 +538,49 @@ def main():
     preview_rows = []
     final_rows = []
 
-    for _, seed in seed_df.iterrows():
+    # Scraping is network-bound, so fetch listings concurrently (Selenium is not thread-safe).
+    # The seed is streamed in chunks: each chunk's listings are fetching while the next is parsed.
+    workers = 1 if args.use_selenium else max(1, args.workers)
+    seed_chunks = []
+    futures = {}
+    with selenium_driver(headless=bool(args.headless)) if args.use_selenium else nullcontext() as get_driver, \
+            ThreadPoolExecutor(max_workers=workers) as ex:
+        try:
+            with pd.read_csv(args.seed, dtype=str, chunksize=SEED_CHUNK_SIZE) as reader:
+                for chunk in reader:
+                    chunk = chunk.fillna("")
+                    urls = seed_column(chunk, "URL").str.strip()
+                    chunk = chunk[urls.ne("")]
+                    for url in urls[urls.ne("")]:
+                        fut = ex.submit(scrape_ebay_listing, url,
+                                        use_selenium=bool(args.use_selenium), headless=bool(args.headless),
+                                        use_cache=not args.no_cache, get_driver=get_driver)
+                        futures[fut] = len(futures)
+                    seed_chunks.append(chunk)
+            scraped_results: List[Optional[ScrapeResult]] = [None] * len(futures)
+            for fut in as_completed(futures):
+                scraped_results[futures[fut]] = fut.result()
+        except BaseException:
+            # Stop on the first failed scrape (or Ctrl-C): drop the queued URLs instead of
+            # letting the executor's shutdown(wait=True) fetch every one before re-raising
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # Seed rows with a URL, in file order and aligned with scraped_results
+    seed_df = pd.concat(seed_chunks, ignore_index=True)
+    seeds = seed_df.to_dict("records")
+
+    # Optimization toggles (respect per-row + global flag), then one batch per field
+    do_title_opt = [(seed.get("OptimizeTitle","Y") == "Y") and bool(args.optimize) for seed in seeds]
+    do_desc_opt  = [(seed.get("OptimizeDescription","Y") == "Y") and bool(args.optimize) for seed in seeds]
+    opt_titles = optimize_selected([s.title for s in scraped_results], do_title_opt, is_title=True)
+    opt_descs  = optimize_selected([s.description_text for s in scraped_results], do_desc_opt, is_title=False)
+
+    for seed, scraped, opt_title, opt_desc in zip(seeds, scraped_results, opt_titles, opt_descs):
         url = seed.get("URL", "").strip()
-        if not url:
-            continue
-
-        scraped = scrape_ebay_listing(url, use_selenium=bool(args.use_selenium), headless=bool(args.headless))
-
-        # Make plain text description for optimization & preview
-        scraped_desc_text = BeautifulSoup(scraped.description_html or "", "lxml").get_text("\n", strip=True)
-
-        # Optimization toggles (respect per-row + global flag)
-        do_title_opt = (seed.get("OptimizeTitle","Y") == "Y") and bool(args.optimize)
-        do_desc_opt  = (seed.get("OptimizeDescription","Y") == "Y") and bool(args.optimize)
 
-        opt_title = openai_optimize(scraped.title, is_title=True) if do_title_opt else scraped.title
-        opt_desc  = openai_optimize(scraped_desc_text, is_title=False) if do_desc_opt else scraped_desc_text
+        # Plain text description for preview
+        scraped_desc_text = scraped.description_text
 
         # Build preview row
         if args.dry_run:
@@ -436,6 +599,8 @@ def main():
         # Build final row data (using optimized texts)
         row = build_output_row(
             headers=headers,
+            header_index=header_index,
+            c_headers=c_headers,
             seed=seed,
             scraped_title=opt_title,
             scraped_desc_text=opt_desc,
@@ -449,8 +614,7 @@ def main():
 
     # Write preview if needed
     if args.dry_run and args.preview:
-        prev_df = pd.DataFrame(preview_rows)
-        prev_df.to_csv(args.preview, index=False)
+        write_csv(args.preview, PREVIEW_COLS, ([r[c] for c in PREVIEW_COLS] for r in preview_rows))
         print(f"Preview written: {args.preview}")
         if not args.write_final:
             print("Dry-run mode: skipping final upload CSV (use --write_final 1 to also write it).")
@@ -458,7 +622,8 @@ def main():
     # Write final if requested (or normal run)
     if (not args.dry_run) or (args.dry_run and args.write_final):
         out_df = pd.DataFrame(final_rows, columns=headers)
-        out_df.to_csv(args.out, index=False)
+        fill_seed_columns(out_df, seed_df, action_col)
+        write_csv(args.out, headers, out_df.itertuples(index=False, name=None))
         print(f"Done. Wrote {len(final_rows)} rows to {args.out}")
 
 
@@ -1,8 +1,10 @@
 
 import argparse
+import functools
 import os
 import re
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 from pathlib import Path
 
 import pandas as pd
@@ -15,6 +17,8 @@ from googleapiclient.discovery import build
 
 SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 
+_LABEL_RE = re.compile(r"[^A-Za-z0-9]+")
+
 def get_service(creds_path: str = "client_secret.json", token_path: str = "token.json"):
     creds = None
     if os.path.exists(token_path):
@@ -38,8 +42,11 @@ def list_files_in_folder(service, folder_id: str) -> List[Dict]:
         resp = service.files().list(
             q=query,
             spaces="drive",
-            fields="nextPageToken, files(id, name, mimeType, parents, webViewLink)",
-            pageToken=page_token
+            fields="nextPageToken, files(id, name, mimeType)",
+            pageSize=1000,
+            pageToken=page_token,
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True
         ).execute()
         files.extend(resp.get("files", []))
         page_token = resp.get("nextPageToken", None)
@@ -50,19 +57,40 @@ def list_files_in_folder(service, folder_id: str) -> List[Dict]:
 def to_direct_image_link(file_id: str) -> str:
     return f"https://drive.google.com/uc?export=view&id={file_id}"
 
+@functools.lru_cache(maxsize=4096)
 def normalize_label(s: str) -> str:
-    return re.sub(r"[^A-Za-z0-9]+", "", (s or "").strip().lower())
+    # No strip() needed: whitespace is removed along with every other non-alphanumeric
+    return _LABEL_RE.sub("", (s or "").lower())
 
 def group_files_by_label(files: List[Dict]) -> Dict[str, List[Dict]]:
-    groups: Dict[str, List[Dict]] = {}
+    groups: Dict[str, List[Dict]] = defaultdict(list)
     for f in files:
         name = f.get("name","")
         base = os.path.splitext(name)[0]
         core = normalize_label(base)
         if not core:
             core = "misc"
-        groups.setdefault(core, []).append(f)
-    return groups
+        groups[core].append(f)
+    return dict(groups)
+
+def trigrams(s: str) -> Set[str]:
+    return {s[i:i+3] for i in range(len(s) - 2)}
+
+def build_trigram_index(keys: List[str]) -> Dict[str, List[str]]:
+    # trigram -> keys containing it, in group order
+    index: Dict[str, List[str]] = defaultdict(list)
+    for key in keys:
+        for tri in trigrams(key):
+            index[tri].append(key)
+    return dict(index)
+
+def keys_containing(label: str, keys: List[str], trigram_index: Dict[str, List[str]]) -> List[str]:
+    # A key containing `label` contains each of its trigrams, so only the
+    # smallest matching trigram list needs the exact substring check
+    if len(label) < 3:
+        return [key for key in keys if label in key]
+    pool = min((trigram_index.get(tri, []) for tri in trigrams(label)), key=len)
+    return [key for key in pool if label in key]
 
 def find_best_image(files: List[Dict]) -> Dict:
     image_files = [f for f in files if f.get("mimeType","").startswith("image/")]
@@ -91,36 +119,43 @@ def main():
         return
 
     groups = group_files_by_label(files)
+    group_keys = list(groups)
+    trigram_index = build_trigram_index(group_keys)
+
+    # Collect PhotoURLs positionally and write the column back once at the end
+    photo_urls = df["PhotoURL"].str.strip().tolist() if "PhotoURL" in df.columns else [""] * len(df)
 
     assigned = 0
     if not args.assign_by_order:
-        for i, row in df.iterrows():
-            label = row.get(args.label_col, "")
-            norm_label = normalize_label(label)
+        labels = df[args.label_col] if args.label_col in df.columns else pd.Series("", index=df.index)
+        # Same as normalize_label, as one pass over the whole column
+        norm_labels = labels.str.lower().str.replace(_LABEL_RE, "", regex=True).to_numpy()
+        for i, norm_label in enumerate(norm_labels):
             if not norm_label:
                 continue
             candidates = []
             if norm_label in groups:
                 candidates = groups[norm_label]
             else:
-                for key, flist in groups.items():
-                    if norm_label in key:
-                        candidates.extend(flist)
+                for key in keys_containing(norm_label, group_keys, trigram_index):
+                    candidates.extend(groups[key])
             if candidates:
                 best = find_best_image(candidates)
                 if best:
-                    df.at[i, "PhotoURL"] = to_direct_image_link(best["id"])
+                    photo_urls[i] = to_direct_image_link(best["id"])
                     assigned += 1
 
     if args.assign_by_order or assigned == 0:
         image_files = [f for f in files if f.get("mimeType","").startswith("image/")]
         image_files.sort(key=lambda x: x.get("name",""))
         idx = 0
-        for i, _ in df.iterrows():
-            if not df.at[i, "PhotoURL"] and idx < len(image_files):
-                df.at[i, "PhotoURL"] = to_direct_image_link(image_files[idx]["id"])
+        for i in range(len(photo_urls)):
+            if not photo_urls[i] and idx < len(image_files):
+                photo_urls[i] = to_direct_image_link(image_files[idx]["id"])
                 idx += 1
 
+    df["PhotoURL"] = photo_urls
+
     df.to_csv(args.out, index=False)
     print(f"Updated seed written to: {args.out}")
 